@@ -43,6 +43,7 @@ class LayoutEditor(PropertiesEditor):
         self._container_options = {}
 
         # Layout Options editors
+        self._propbag = {}
         self._rcbag = {}  # bag for row/column prop editors
         # main options frame
         # self._fprop = fprop = ttk.Labelframe(self._sframe.innerframe,
@@ -63,7 +64,6 @@ class LayoutEditor(PropertiesEditor):
         w.grid(row=1, column=0, columnspan=2, sticky="ew", pady=4)
 
         # Other Layout properties
-        label_tpl = "{0}:"
         row = 2
         col = 0
 
@@ -74,8 +74,7 @@ class LayoutEditor(PropertiesEditor):
         for gcode, plist, propdescr in self._groups:
             for name in plist:
                 kwdata = propdescr[name]
-                labeltext = label_tpl.format(name)
-                label = ttk.Label(self._fprop, text=labeltext, anchor=tk.W)
+                label = ttk.Label(self._fprop, text=name + ":", anchor=tk.W)
                 label.grid(row=row, column=col, sticky=tk.EW, pady=2)
                 label.tooltip = create_tooltip(label, "?")
                 widget = self._create_editor(self._fprop, name, kwdata)
@@ -213,6 +212,6 @@ class LayoutEditor(PropertiesEditor):
         editor.edit(value)
 
     def hide_all(self):
-        super().hide_all()
+        self._current = None
         self._fprop.grid_remove()
         self._cleditor.grid_remove()
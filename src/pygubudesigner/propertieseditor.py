@@ -15,7 +15,9 @@
 
 import logging
 import tkinter as tk
+import tkinter.font as tkfont
 import tkinter.ttk as ttk
+from contextlib import contextmanager
 
 from pygubu import builder
 from pygubu.widgets.simpletooltip import create as create_tooltip
@@ -29,13 +31,80 @@ from .stylehandler import StyleHandler
 logger = logging.getLogger(__name__)
 CLASS_MAP = builder.CLASS_MAP
 
+# Group header paddings
+_HDR_PAD_FIRST = "0 0 0 5"
+_HDR_PAD = "0 5 0 5"
+
+EDIT_DELAY_MILISECONDS = 30
+
+# GroupCode, PropertyType, property names, property descriptions.
+# PropertyType is the builder attribute that lists the group properties
+# used by a widget class, required properties are used by all classes.
+_GROUPS = (
+    (
+        "00",
+        None,
+        properties.WIDGET_REQUIRED_OPTIONS,
+        properties.REQUIRED_OPTIONS,
+    ),
+    (
+        "01",
+        "OPTIONS_STANDARD",
+        properties.WIDGET_STANDARD_OPTIONS,
+        properties.TK_WIDGET_OPTIONS,
+    ),
+    (
+        "02",
+        "OPTIONS_SPECIFIC",
+        properties.WIDGET_SPECIFIC_OPTIONS,
+        properties.TK_WIDGET_OPTIONS,
+    ),
+    (
+        "03",
+        "OPTIONS_CUSTOM",
+        properties.WIDGET_CUSTOM_OPTIONS,
+        properties.CUSTOM_OPTIONS,
+    ),
+)
+
+
+def _class_help(help, classname):
+    """Return the help string of the first prefix that matches classname.
+
+    help is a dict of classname prefixes, like "tk" or "ttk", to help
+    strings. Called once per class and property, results are kept in the
+    PropertiesEditor class plans.
+    """
+    # FIXME: review this process for custom properties.
+    return next(
+        (text for prefix, text in help.items() if classname.startswith(prefix)),
+        "",  # No help string found
+    )
+
 
 class PropertiesEditor:
+    header_font = None
+
     def __init__(self, frame, **kw):
         self._current = None
         self._sframe = frame
         self._frame = None
-        self._propbag = {}
+        # Property rows definition, indexed by row id
+        self._gcodes = []
+        self._attrnames = []
+        self._pnames = []
+        self._grid_rows = []
+        self._pdescrs = []
+        # Label of each row, None if the row is hidden
+        self._labels = []
+        self._label_pool = []  # labels not used by a visible row
+        self._editors = {}  # row id -> editor
+        self._visible_rowids = frozenset()
+        self._class_plan_cache = {}
+        self._batch_level = 0
+        self._edit_cbid = None  # pending edit callback id
+        self._changed = {}  # property name -> editor, not yet saved
+        self._flush_cbid = None  # pending flush callback id
         self._create_properties()
 
         # Used for refreshing/re-populating the styles combobox.
@@ -57,59 +126,76 @@ class PropertiesEditor:
         # f.configure(padding=4)
         f.grid(sticky="nswe")
 
-        label_tpl = "{0}:"
-        row = 0
-        col = 0
-
-        groups = (
-            (
-                "00",
-                _("Required"),
-                properties.WIDGET_REQUIRED_OPTIONS,
-                properties.REQUIRED_OPTIONS,
-            ),
-            (
-                "01",
-                _("Standard"),
-                properties.WIDGET_STANDARD_OPTIONS,
-                properties.TK_WIDGET_OPTIONS,
-            ),
-            (
-                "02",
-                _("Specific"),
-                properties.WIDGET_SPECIFIC_OPTIONS,
-                properties.TK_WIDGET_OPTIONS,
-            ),
-            (
-                "03",
-                _("Custom"),
-                properties.WIDGET_CUSTOM_OPTIONS,
-                properties.CUSTOM_OPTIONS,
-            ),
-        )
+        if PropertiesEditor.header_font is None:
+            PropertiesEditor.header_font = tkfont.Font(
+                f, family="TkDefaultFont", size=10, weight="bold"
+            )
+
+        group_names = {
+            "00": _("Required"),
+            "01": _("Standard"),
+            "02": _("Specific"),
+            "03": _("Custom"),
+        }
 
-        for gcode, gname, plist, propdescr in groups:
-            padding = "0 0 0 5" if row == 0 else "0 5 0 5"
+        row = 0
+        for gcode, attrname, plist, propdescr in _GROUPS:
+            padding = _HDR_PAD_FIRST if row == 0 else _HDR_PAD
             label = ttk.Label(
                 self._frame,
-                text=gname,
-                font="TkDefaultFont 10 bold",
+                text=group_names[gcode],
+                font=self.header_font,
                 padding=padding,
                 foreground="#000059",
             )
             label.grid(row=row, column=0, sticky="we", columnspan=2)
             row += 1
             for name in plist:
-                kwdata = propdescr[name]
-                labeltext = label_tpl.format(name)
-                label = ttk.Label(self._frame, text=labeltext, anchor=tk.W)
-                label.grid(row=row, column=col, sticky=tk.EW, pady=2)
-                label.tooltip = create_tooltip(label, "?")
-                widget = self._create_editor(self._frame, name, kwdata)
-                widget.grid(row=row, column=col + 1, sticky=tk.EW, pady=2)
+                # Reserve the grid row, editors are created on first use.
+                self._gcodes.append(gcode)
+                self._attrnames.append(attrname)
+                self._pnames.append(name)
+                self._grid_rows.append(row)
+                self._pdescrs.append(propdescr[name])
+                self._labels.append(None)
                 row += 1
-                self._propbag[gcode + name] = (label, widget)
-                logger.debug("Created property: %s-%s", gname, name)
+
+    def _ensure_editor(self, rowid):
+        """Return the editor for row rowid, creating it if needed."""
+        editor = self._editors.get(rowid, None)
+        if editor is None:
+            name = self._pnames[rowid]
+            editor = self._create_editor(
+                self._frame, name, self._pdescrs[rowid]
+            )
+            editor.grid(
+                row=self._grid_rows[rowid], column=1, sticky=tk.EW, pady=2
+            )
+            # Last parameters applied by _apply_resolved()
+            editor._last_params = None
+            self._editors[rowid] = editor
+            logger.debug("Created property: %s-%s", self._gcodes[rowid], name)
+        return editor
+
+    def _show_label(self, rowid):
+        """Grid a label for row rowid, reusing a pooled one if any."""
+        text = self._pnames[rowid] + ":"
+        if self._label_pool:
+            label = self._label_pool.pop()
+            label.configure(text=text)
+        else:
+            label = ttk.Label(self._frame, text=text, anchor=tk.W)
+            label.tooltip = create_tooltip(label, "?")
+        label.grid(row=self._grid_rows[rowid], column=0, sticky=tk.EW, pady=2)
+        self._labels[rowid] = label
+        return label
+
+    def _hide_label(self, rowid):
+        """Hide the label of row rowid and return it to the pool."""
+        label = self._labels[rowid]
+        self._labels[rowid] = None
+        label.grid_remove()
+        self._label_pool.append(label)
 
     def _create_editor(self, master, pname, wdata):
         editor = None
@@ -119,115 +205,200 @@ class PropertiesEditor:
         # so setup class specific values on update_property_widget
         editor = create_editor(wtype, master)
 
-        def make_on_change_cb(pname, editor):
-            def on_change_cb(event):
-                self._on_property_changed(pname, editor)
-
-            return on_change_cb
-
-        editor.bind("<<PropertyChanged>>", make_on_change_cb(pname, editor))
+        editor._pname = pname
+        editor.bind("<<PropertyChanged>>", self._on_property_changed_event)
         return editor
 
+    def _on_property_changed_event(self, event):
+        editor = event.widget
+        self._on_property_changed(editor._pname, editor)
+
     def _on_property_changed(self, name, editor):
-        self._current.widget_property(name, editor.value)
+        # Save changes when Tk is idle, so several events for the same
+        # property produce a single widget update.
+        self._changed[name] = editor
+        if self._flush_cbid is None:
+            self._flush_cbid = self._sframe.after_idle(self.flush_changes)
 
-    def update_editor(self, label, editor, wdescr, pname, propdescr):
-        pdescr = propdescr.copy()
-        classname = wdescr.classname
-
-        # Get editor default mode
-        default_mode = None
-        if "params" in pdescr:
-            default_mode = pdescr["params"].get("mode", None)
-        # Get editor parameters for a specific class
-        if classname in pdescr:
-            pdescr = dict(pdescr, **pdescr[classname])
-
-        params = pdescr.get("params", {})
-        # setup default mode if not specified in parameters for
+    def flush_changes(self):
+        """Save the pending property changes in the edited widget.
+
+        Property changes are saved when Tk is idle, code that reads the
+        widget properties right after an editor event must call this
+        first. Also called before editing another widget.
+        """
+        if self._flush_cbid is not None:
+            self._sframe.after_cancel(self._flush_cbid)
+            self._flush_cbid = None
+        changed, self._changed = self._changed, {}
+        if self._current is None:
+            # Late event from an editor (e.g. a key press timer) after
+            # hide_all(), there is no widget to save it to.
+            return
+        for name, editor in changed.items():
+            self._current.widget_property(name, editor.value)
+
+    def _resolve_property(self, classname, propdescr):
+        """Return editor params, help and default value for classname."""
+        # Values for a specific class override the property ones,
+        # read them in place instead of merging the dicts.
+        override = propdescr.get(classname, {})
+        params = override.get("params", propdescr.get("params", {}))
+
+        # setup editor default mode if not specified in parameters for
         # specific class
+        default_mode = propdescr.get("params", {}).get("mode", None)
         if default_mode is not None and "mode" not in params:
-            params["mode"] = default_mode
+            params = dict(params, mode=default_mode)
+
+        # Setup tooltip
+        help = override.get("help", propdescr.get("help", None))
+        if isinstance(help, dict):
+            help = _class_help(help, classname)
+
+        default = override.get("default", propdescr.get("default", ""))
+        return params, help, default
+
+    def _class_plan(self, classname):
+        """Return the resolved property rows for widget class classname.
 
+        Also returns the frozenset of the row ids, used to find the rows
+        to show or hide. Both are computed the first time a class is
+        edited and reused for every other widget of the same class.
+        """
+        cached = self._class_plan_cache.get(classname, None)
+        if cached is None:
+            class_descr = CLASS_MAP[classname].builder
+            # Read each builder options attribute once, as a set.
+            allowed = {
+                attrname: frozenset(getattr(class_descr, attrname))
+                for gcode, attrname, plist, pdescr in _GROUPS
+                if attrname is not None
+            }
+
+            plan = []
+            for rowid, attrname in enumerate(self._attrnames):
+                if attrname is None or self._pnames[rowid] in allowed[attrname]:
+                    widget = self._ensure_editor(rowid)
+                    resolved = self._resolve_property(
+                        classname, self._pdescrs[rowid]
+                    )
+                    plan.append((rowid, widget, resolved))
+            rowids = frozenset(entry[0] for entry in plan)
+            cached = self._class_plan_cache[classname] = (plan, rowids)
+        return cached
+
+    def update_editor(self, label, editor, wdescr, pname, propdescr):
+        resolved = self._resolve_property(wdescr.classname, propdescr)
+        self._apply_resolved(label, editor, wdescr, pname, *resolved)
+
+    def _apply_resolved(
+        self, label, editor, wdescr, pname, params, help, default
+    ):
+        """Update editor with the resolved params, help and default."""
         # Setup name placeholder
         if pname == "id" and isinstance(editor, NamedIDPropertyEditor):
-            params["placeholder"] = wdescr.start_id
+            params = dict(params, placeholder=wdescr.start_id)
 
-        # Configure editor
-        editor.parameters(**params)
+        # Configure editor, skip it if parameters did not change.
+        # Style choices depend on the previewed widget and the loaded
+        # style definitions, so that editor is always configured.
+        if (
+            params != editor._last_params
+            or params.get("mode", None) == "ttkstylechoice"
+        ):
+            editor.parameters(**params)
+            editor._last_params = params
 
         # Setup tooltip
-        help = pdescr.get("help", None)
-        if isinstance(help, dict):
-            found_match = False
-            for k, v in help.items():
-                if classname.startswith(k):
-                    help = v
-                    found_match = True
-                    break
-            # FIXME: review this process for custom properties.
-            if not found_match:
-                help = ""  # No help string found
-        label.tooltip.text = help
+        if label.tooltip.text != help:
+            label.tooltip.text = help
 
         # setup default value
-        default = pdescr.get("default", "")
         value = wdescr.widget_property(pname)
 
         if not value and default:
             value = default
+        # Always edit, it also resets any uncommitted or invalid input
+        # left on the editor.
         editor.edit(value)
 
     def edit(self, wdescr):
-        self._current = wdescr
-        wclass = wdescr.classname
-        class_descr = CLASS_MAP[wclass].builder
-
-        # GroupCode, PropertyType, dict, tuple
-        groups = (
-            (
-                "00",
-                None,
-                properties.WIDGET_REQUIRED_OPTIONS,
-                properties.REQUIRED_OPTIONS,
-            ),
-            (
-                "01",
-                "OPTIONS_STANDARD",
-                properties.WIDGET_STANDARD_OPTIONS,
-                properties.TK_WIDGET_OPTIONS,
-            ),
-            (
-                "02",
-                "OPTIONS_SPECIFIC",
-                properties.WIDGET_SPECIFIC_OPTIONS,
-                properties.TK_WIDGET_OPTIONS,
-            ),
-            (
-                "03",
-                "OPTIONS_CUSTOM",
-                properties.WIDGET_CUSTOM_OPTIONS,
-                properties.CUSTOM_OPTIONS,
-            ),
+        """Show the properties of wdescr.
+
+        The editors are updated after a short delay, so a burst of calls
+        (e.g. moving through the widget tree with the keyboard) only
+        updates them for the last widget.
+        """
+        self._cancel_pending_edit()
+        self._edit_cbid = self._sframe.after(
+            EDIT_DELAY_MILISECONDS, self._edit_now, wdescr
         )
-        for gcode, attrname, proplist, gproperties in groups:
-            for name in proplist:
-                propdescr = gproperties[name]
-                label, widget = self._propbag[gcode + name]
-                if gcode == "00" or name in getattr(class_descr, attrname):
-                    self.update_editor(label, widget, wdescr, name, propdescr)
-                    label.grid()
+
+    def _cancel_pending_edit(self):
+        if self._edit_cbid is not None:
+            self._sframe.after_cancel(self._edit_cbid)
+            self._edit_cbid = None
+
+    def _edit_now(self, wdescr):
+        self._edit_cbid = None
+        self.flush_changes()
+        self._current = wdescr
+
+        cached = self._class_plan_cache.get(wdescr.classname, None)
+        if (
+            cached is not None
+            and cached[1] is self._visible_rowids
+            and self._frame.winfo_manager()
+        ):
+            # The rows of this class are already shown (e.g. the same or
+            # a sibling widget was selected), just refresh the editors.
+            for rowid, widget, resolved in cached[0]:
+                label = self._labels[rowid]
+                pname = self._pnames[rowid]
+                self._apply_resolved(label, widget, wdescr, pname, *resolved)
+            return
+
+        with self._batch_updates():
+            plan, rowids = self._class_plan(wdescr.classname)
+
+            # hide only the properties not used by this widget class
+            for rowid in self._visible_rowids - rowids:
+                self._editors[rowid].grid_remove()
+                self._hide_label(rowid)
+            for rowid, widget, resolved in plan:
+                label = self._labels[rowid]
+                if label is None:
+                    label = self._show_label(rowid)
                     widget.grid()
-                else:
-                    # hide property widget
-                    label.grid_remove()
-                    widget.grid_remove()
-        self._sframe.reposition()
+                pname = self._pnames[rowid]
+                self._apply_resolved(label, widget, wdescr, pname, *resolved)
+        self._visible_rowids = rowids
+
+    @contextmanager
+    def _batch_updates(self):
+        """Unmap the properties frame while rows are shown or hidden.
+
+        Tk computes the layout once when the frame is mapped again
+        instead of after every grid change. Calls can be nested, only
+        the outermost one remaps the frame and repositions the view.
+        """
+        if self._batch_level == 0:
+            self._frame.grid_remove()
+        self._batch_level += 1
+        try:
+            yield
+        finally:
+            self._batch_level -= 1
+            if self._batch_level == 0:
+                self._frame.grid()
+                self._sframe.reposition()
 
     def hide_all(self):
         """Hide all properties from property editor."""
-        self.current = None
-
-        for _v, (label, widget) in self._propbag.items():
-            label.grid_remove()
-            widget.grid_remove()
+        self._cancel_pending_edit()
+        self.flush_changes()
+        self._current = None
+        # Unmap the whole frame, the rows keep their state and the next
+        # edit() only shows or hides the rows that differ.
+        self._frame.grid_remove()
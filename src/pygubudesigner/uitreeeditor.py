@@ -552,6 +552,14 @@ class WidgetsTreeEditor:
 
         del self.treedata[item]
 
+    def flush_property_changes(self):
+        """Save property changes not yet applied to the widget data.
+
+        Call it before reading the widget data (serialize, copy, etc.),
+        the properties editor applies changes when Tk is idle.
+        """
+        self.properties_editor.flush_changes()
+
     def new_uidefinition(self):
         author = f"PygubuDesigner {pygubudesigner.__version__}"
         uidef = UIDefinition(wmetaclass=WidgetMeta)
@@ -561,6 +569,8 @@ class WidgetsTreeEditor:
     def tree_to_uidef(self, treeitem=None):
         """Traverses treeview and generates a ElementTree object"""
 
+        self.flush_property_changes()
+
         # Need to remove filter or hidden items will not be saved.
         self.filter_remove(remember=True)
 
@@ -661,6 +671,7 @@ class WidgetsTreeEditor:
         selection = tree.selection()
         logger.debug("Selection %s", selection)
         if selection:
+            self.flush_property_changes()
             self.filter_remove(remember=True)
 
             uidef = self.new_uidefinition()
@@ -1402,6 +1413,7 @@ class WidgetsTreeEditor:
 
     def is_id_unique(self, idvalue) -> bool:
         "Check if idvalue is unique in all UI tree."
+        self.flush_property_changes()
         is_unique = (
             not self._is_id_defined("", idvalue)
             and not self._is_tkvar_defined("", idvalue)
@@ -1479,6 +1491,7 @@ class WidgetsTreeEditor:
 
     def is_command_valid(self, cmdname):
         """Check if command name does not collide with other names."""
+        self.flush_property_changes()
         is_valid = (
             not self._is_id_defined("", cmdname)
             and not self._is_binding_defined("", cmdname)
@@ -1488,6 +1501,7 @@ class WidgetsTreeEditor:
 
     def is_tkvar_valid(self, varname):
         """Check if tkvarname does not collide with other names."""
+        self.flush_property_changes()
         is_valid = (
             not self._is_id_defined("", varname)
             and not self._is_command_defined("", varname)
@@ -1497,6 +1511,7 @@ class WidgetsTreeEditor:
 
     def is_binding_valid(self, cmdname):
         """Check if binding name does not collide with other names."""
+        self.flush_property_changes()
         is_valid = (
             not self._is_id_defined("", cmdname)
             and not self._is_command_defined("", cmdname)
@@ -1506,6 +1521,8 @@ class WidgetsTreeEditor:
 
     def _on_reset_id_requested(self, event=None):
         item = self.current_edit
+        # A pending id change would overwrite the new id
+        self.flush_property_changes()
         wmeta = self.treedata[item]
         # Stop listening object updates
         self._listen_object_updates = False